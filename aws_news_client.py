@@ -0,0 +1,226 @@
+import httpx
+import os
+import time
+from datetime import datetime
+from cachetools import LRUCache
+from typing import Optional, List, Dict, Any, Tuple
+from serialization import loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Shared client so that connections to the news API are pooled and kept alive
+# across tool invocations instead of paying a TCP+TLS handshake on every call.
+# HTTP/2 lets concurrent tool calls share one connection, and compressed
+# responses cut the bytes transferred for large article lists.
+_CLIENT = httpx.AsyncClient(
+    base_url="https://api.aws-news.com",
+    http2=True,
+    headers={"accept-encoding": "gzip, br", "user-agent": "aws-news-mcp/1.0"},
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=httpx.Timeout(30.0, connect=10.0),
+)
+
+# Cache of (etag, articles, fetched_at) keyed by the normalized request
+# arguments. News for a topic changes on the order of minutes, so repeat tool
+# calls within the TTL are served from memory; after that the entry is
+# revalidated with a conditional GET. Set AWS_NEWS_CACHE_TTL=0 to disable.
+_CACHE_TTL = int(os.getenv("AWS_NEWS_CACHE_TTL", "300"))
+_CACHE = LRUCache(maxsize=512) if _CACHE_TTL > 0 else None
+
+# Page sizes at or above this are stream-parsed with ijson so decoding overlaps
+# the download; smaller responses are cheaper to buffer and decode with orjson
+_STREAM_THRESHOLD = 100
+
+# Maps the tool's news_type values to the API's article_type filter
+_TYPE_MAP = {"news": "news", "blogs": "blog", "blog": "blog"}
+
+# Returned by the fetch helpers when a revalidation request gets 304 Not Modified
+_NOT_MODIFIED = object()
+
+
+def validate_since_date(since_date: str) -> None:
+    """
+    Validate that a date string is in ISO 8601 format.
+
+    Args:
+        since_date: The date string to validate
+
+    Raises:
+        ValueError: If the date is not in ISO 8601 format
+    """
+    try:
+        datetime.fromisoformat(since_date.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError(
+            "Invalid date format. Please use ISO 8601 format (e.g., 2025-05-01T00:00:00Z)")
+
+
+class _ResponseReader:
+    """
+    Adapts a streamed httpx response to the async file interface ijson reads from.
+    """
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        # Raw body kept until the first article is parsed, so a response that
+        # is not a top-level array can still be decoded as a whole
+        self.body: Optional[List[bytes]] = []
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with a zero-length read
+        if size == 0:
+            return b""
+        chunk = await anext(self._chunks, b"")
+        if self.body is not None:
+            self.body.append(chunk)
+        return chunk
+
+
+def _decode_articles(content: bytes, limit: int) -> Any:
+    """
+    Decode a buffered articles response.
+
+    Args:
+        content: Raw JSON response body
+        limit: Maximum number of articles to return
+
+    Returns:
+        List of news articles, capped at limit
+    """
+    data = loads(content)
+    if isinstance(data, list):
+        return data[:limit]
+    return data
+
+
+async def _get_articles(
+    params: Dict[str, Any], headers: Dict[str, str], limit: int
+) -> Tuple[Optional[str], Any]:
+    """
+    Fetch articles and decode the buffered response body.
+
+    Args:
+        params: Query parameters for the articles endpoint
+        headers: Extra request headers
+        limit: Maximum number of articles to return
+
+    Returns:
+        The response ETag and list of news articles, or _NOT_MODIFIED for
+        the articles if a conditional request got 304 Not Modified
+    """
+    response = await _CLIENT.get("/articles", params=params, headers=headers)
+    if response.status_code == 304 and "if-none-match" in headers:
+        return None, _NOT_MODIFIED
+    response.raise_for_status()
+    return response.headers.get("etag"), _decode_articles(response.content, limit)
+
+
+async def _stream_articles(
+    params: Dict[str, Any], headers: Dict[str, str], limit: int
+) -> Tuple[Optional[str], Any]:
+    """
+    Fetch articles and parse them incrementally as the response body arrives.
+
+    Args:
+        params: Query parameters for the articles endpoint
+        headers: Extra request headers
+        limit: Maximum number of articles to parse
+
+    Returns:
+        The response ETag and list of news articles, or _NOT_MODIFIED for
+        the articles if a conditional request got 304 Not Modified
+    """
+    articles = []
+    async with _CLIENT.stream("GET", "/articles", params=params, headers=headers) as response:
+        if response.status_code == 304 and "if-none-match" in headers:
+            return None, _NOT_MODIFIED
+        response.raise_for_status()
+        reader = _ResponseReader(response)
+        async for article in ijson.items_async(reader, "item", use_float=True):
+            reader.body = None
+            articles.append(article)
+            if len(articles) >= limit:
+                break
+    # Nothing matched the top-level array, so decode the body as a whole rather
+    # than reporting an unexpected response shape as no news
+    if reader.body is not None:
+        return response.headers.get("etag"), _decode_articles(b"".join(reader.body), limit)
+    return response.headers.get("etag"), articles
+
+
+async def fetch_aws_news(
+    topic: str,
+    news_type: str = "all",
+    include_regional_expansions: bool = False,
+    limit: int = 40,
+    since_date: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch AWS news articles based on the provided parameters.
+
+    Args:
+        topic: The AWS topic/service to search for
+        news_type: Type of news to fetch ('all', 'news', 'blogs')
+        include_regional_expansions: Whether to include regional expansion news
+        limit: Maximum number of results to return
+        since_date: Optional ISO 8601 date to filter results
+
+    Returns:
+        List of news articles
+    """
+    news_type = news_type.lower()
+
+    # Validate the date filter if provided
+    if since_date:
+        validate_since_date(since_date)
+
+    # Build query parameters, leaving out filters that are not set since httpx
+    # would otherwise send them as empty values
+    params = {
+        "page_size": limit,
+        # httpx renders bools as "true"/"false"; keep the API's "True"/"False"
+        "hide_regional_expansions": str(not include_regional_expansions),
+        "search": topic,
+        "article_type": _TYPE_MAP.get(news_type),
+        "since": since_date or None,
+    }
+    params = {k: v for k, v in params.items() if v is not None}
+
+    # Serve repeat requests from the cache while fresh, and revalidate stale
+    # entries with If-None-Match so an unchanged response skips the decode
+    key = (topic.lower(), news_type,
+           include_regional_expansions, limit, since_date)
+    entry = _CACHE.get(key) if _CACHE is not None else None
+    headers = {}
+    if entry is not None:
+        etag, articles, fetched_at = entry
+        if time.monotonic() - fetched_at < _CACHE_TTL:
+            return articles
+        if etag:
+            headers["if-none-match"] = etag
+
+    # Make the request
+    if ijson is not None and limit >= _STREAM_THRESHOLD:
+        etag, data = await _stream_articles(params, headers, limit)
+    else:
+        etag, data = await _get_articles(params, headers, limit)
+
+    # Not modified, so keep the cached articles. The conditional header is only
+    # sent for an existing entry, so entry is always set here.
+    if data is _NOT_MODIFIED:
+        etag, data, _ = entry
+
+    if _CACHE is not None:
+        _CACHE[key] = (etag, data, time.monotonic())
+    return data
+
+
+async def aclose() -> None:
+    """
+    Close the shared HTTP client and its pooled connections.
+    """
+    await _CLIENT.aclose()
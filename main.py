@@ -1,73 +1,43 @@
-import httpx
+import asyncio
 import click
+import os
 import sys
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-import json
-from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional, List
 from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool
+from aws_news_client import fetch_aws_news, aclose
+from serialization import dumps
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-async def fetch_aws_news(
-    topic: str,
-    news_type: str = "all",
-    include_regional_expansions: bool = False,
-    limit: int = 40,
-    since_date: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    """
-    Fetch AWS news articles based on the provided parameters.
+# Responses with more articles than this are serialized off the event loop
+_OFFLOAD_THRESHOLD = 50
 
-    Args:
-        topic: The AWS topic/service to search for
-        news_type: Type of news to fetch ('all', 'news', 'blogs')
-        include_regional_expansions: Whether to include regional expansion news
-        limit: Maximum number of results to return
-        since_date: Optional ISO 8601 date to filter results
 
-    Returns:
-        List of news articles
+class AwsNewsMCP(FastMCP):
+    """
+    FastMCP server that builds its tool list once.
+
+    The registered tools never change after startup, so the Tool objects
+    (description and input schema) are built on the first list_tools call
+    and reused for every subsequent call.
     """
-    base_url = "https://api.aws-news.com/articles"
-
-    # Build query parameters
-    params = {
-        "page_size": limit,
-        "hide_regional_expansions": not include_regional_expansions,
-        "search": topic
-    }
-
-    # Add article type filter if specified
-    if news_type.lower() == "news":
-        params["article_type"] = "news"
-    elif news_type.lower() == "blogs" or news_type.lower() == "blog":
-        params["article_type"] = "blog"
-
-    # Add date filter if provided
-    if since_date:
-        try:
-            # Validate the date format
-            datetime.fromisoformat(since_date.replace('Z', '+00:00'))
-            params["since"] = since_date
-        except ValueError:
-            raise ValueError(
-                "Invalid date format. Please use ISO 8601 format (e.g., 2025-05-01T00:00:00Z)")
-
-    # Construct the URL with query parameters
-    url = f"{base_url}?{urlencode(params)}"
-
-    # Make the request
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        response.raise_for_status()
-
-        # Parse and return the JSON response
-        data = response.json()
-        return data
+
+    _tools: Optional[List[Tool]] = None
+
+    async def list_tools(self) -> List[Tool]:
+        if self._tools is None:
+            self._tools = await super().list_tools()
+        return self._tools
 
 
 # Create FastMCP server
-mcp = FastMCP("aws-news-mcp-server")
+mcp = AwsNewsMCP("aws-news-mcp-server")
 
 
 @mcp.tool(
@@ -130,7 +100,12 @@ async def get_aws_news(
             "articles": news_articles
         }
 
-        return json.dumps(result, indent=2)
+        # Serialize large payloads on the thread pool rather than the event loop
+        # thread. orjson holds the GIL while encoding, so this does not let other
+        # coroutines run during the encode itself.
+        if isinstance(news_articles, list) and len(news_articles) > _OFFLOAD_THRESHOLD:
+            return await asyncio.get_running_loop().run_in_executor(None, dumps, result)
+        return dumps(result)
     except Exception as e:
         return f"Error fetching AWS news: {str(e)}"
 
@@ -150,6 +125,26 @@ def prompt_aws_blogs(topics: str, days_ago=90) -> str:
     return f"Tell me the latest AWS blog posts for {topics} over the past {days_ago} days."
 
 
+@asynccontextmanager
+async def lifespan(app=None):
+    """
+    Set up shared resources for a server run and release them when it stops.
+    """
+    # Size the default executor up front so blocking work offloaded from
+    # concurrent tool calls does not queue behind a small pool
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=int(os.getenv("THREAD_POOL_SIZE", "32"))))
+    try:
+        yield
+    finally:
+        await aclose()
+
+
+async def arun():
+    async with lifespan():
+        await mcp.run_stdio_async()
+
+
 @click.command()
 @click.option("--port", default=8000, help="Port to listen on for HTTP server")
 @click.option(
@@ -161,11 +156,19 @@ def prompt_aws_blogs(topics: str, days_ago=90) -> str:
 def main(port: int = 8000, transport: str = "stdio", standalone_mode: bool = True) -> int:
     if transport == "http":
         import uvicorn
-        from mcp.server.sse import create_sse_app
-        app = create_sse_app(mcp)
-        uvicorn.run(app, host="0.0.0.0", port=port)
+        from starlette.applications import Starlette
+        from starlette.routing import Mount
+        app = Starlette(routes=[Mount("/", app=mcp.sse_app())],
+                        lifespan=lifespan)
+        # uvicorn's "auto" loop and http settings already pick uvloop and
+        # httptools when they are installed
+        uvicorn.run(app, host="0.0.0.0", port=port,
+                    log_level="warning", access_log=False)
     else:
-        mcp.run()
+        # uvloop has lower scheduling overhead than the default selector loop
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(arun())
     return 0
 
 
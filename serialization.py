@@ -0,0 +1,37 @@
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string, using orjson when available.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data: bytes) -> Any:
+    """
+    Deserialize JSON bytes, using orjson when available.
+
+    Args:
+        data: Raw JSON bytes
+
+    Returns:
+        The decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)